@@ -5,16 +5,39 @@
 
 import re
 import os
+import sys
 import tempfile
 import json
 import itertools
-from typing import Callable, Optional, Tuple, Mapping, Sequence, Any
+import functools
+import queue
+import shutil
+import shlex
+import threading
+from typing import (
+    Callable,
+    Optional,
+    Tuple,
+    Mapping,
+    Sequence,
+    Any,
+    Dict,
+    List,
+    Pattern,
+    Set,
+)
 from tabulate import tabulate
 from subprocess import Popen, PIPE, CalledProcessError
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Flag, auto
 
 
+# Slotted dataclasses avoid a per-instance __dict__ (smaller instances, faster field access).
+# dataclass only supports `slots` on python 3.10+.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class Flow(Flag):
     # Tests that are run on PRs
     LAND_BLOCKING = auto()
@@ -36,32 +59,84 @@ class Flow(Flag):
 # Tests that are run on LAND_BLOCKING and continuously on main
 LAND_BLOCKING_AND_C = Flow.LAND_BLOCKING | Flow.CONTINUOUS
 
-SELECTED_FLOW = Flow[os.environ.get("FLOW", default="LAND_BLOCKING")]
+DEFAULT_MAX_BLOCK_SIZE = "10000"
 
-print(f"Executing flow: {SELECTED_FLOW}")
-IS_MAINNET = SELECTED_FLOW in [Flow.MAINNET, Flow.MAINNET_LARGE_DB]
-SOURCE = os.environ.get("SOURCE", default="LOCAL")
-if SOURCE not in ["ADHOC", "CI", "LOCAL"]:
-    print(f"Unrecogznied source {SOURCE}")
-    exit(1)
 
-RUNNER_NAME = os.environ.get("RUNNER_NAME", default="none")
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class Config:
+    flow: Flow
+    source: str
+    runner_name: str
+    max_block_size: int
+    num_blocks: int
+    num_init_accounts: int
+    # default to using production number of execution threads for assertions
+    number_of_execution_threads: int
+    detailed: bool
+    release_build: bool
+    prod_db_flags: bool
+    disable_fa_apt: bool
+    # native executor doesn't support FA APT, so it is skipped when it is enabled
+    skip_native: bool
+    enable_pruner: bool
+    hide_output: bool
+    skip_move_e2e: bool
+    # reprint all result tables after every test, instead of only the rows of the test
+    verbose_progress: bool
+    # number of benchmark runs (of any tests) to execute concurrently, each against its own copy of the warmup DB
+    parallel_runs: int
+
+
+def _load_config() -> Config:
+    """Reads all environment knobs once, so the rest of the script only does field lookups."""
+    flow = Flow[os.environ.get("FLOW", default="LAND_BLOCKING")]
+    disable_fa_apt = bool(os.environ.get("DISABLE_FA_APT"))
+    return Config(
+        flow=flow,
+        source=os.environ.get("SOURCE", default="LOCAL"),
+        runner_name=os.environ.get("RUNNER_NAME", default="none"),
+        max_block_size=int(
+            os.environ.get("MAX_BLOCK_SIZE", default=DEFAULT_MAX_BLOCK_SIZE)
+        ),
+        num_blocks=int(os.environ.get("NUM_BLOCKS_PER_TEST", default=15)),
+        num_init_accounts=int(
+            os.environ.get(
+                "NUM_INIT_ACCOUNTS",
+                default="100000000" if flow == Flow.MAINNET_LARGE_DB else "2000000",
+            )
+        ),
+        number_of_execution_threads=int(
+            os.environ.get("NUMBER_OF_EXECUTION_THREADS", default=32)
+        ),
+        detailed=bool(os.environ.get("DETAILED")),
+        release_build=bool(os.environ.get("RELEASE_BUILD")),
+        prod_db_flags=bool(os.environ.get("PROD_DB_FLAGS")),
+        disable_fa_apt=disable_fa_apt,
+        skip_native=not disable_fa_apt,
+        enable_pruner=bool(os.environ.get("ENABLE_PRUNER")),
+        hide_output=bool(os.environ.get("HIDE_OUTPUT")),
+        skip_move_e2e=bool(os.environ.get("SKIP_MOVE_E2E")),
+        verbose_progress=bool(os.environ.get("VERBOSE_PROGRESS")),
+        parallel_runs=max(1, int(os.environ.get("PARALLEL_RUNS", default=1))),
+    )
+
 
-DEFAULT_NUM_INIT_ACCOUNTS = (
-    "100000000" if SELECTED_FLOW == Flow.MAINNET_LARGE_DB else "2000000"
-)
-DEFAULT_MAX_BLOCK_SIZE = "10000"
+CONFIG = _load_config()
+
+print(f"Executing flow: {CONFIG.flow}")
+IS_MAINNET = CONFIG.flow in [Flow.MAINNET, Flow.MAINNET_LARGE_DB]
+if CONFIG.source not in ["ADHOC", "CI", "LOCAL"]:
+    print(f"Unrecogznied source {CONFIG.source}")
+    exit(1)
 
-MAX_BLOCK_SIZE = int(os.environ.get("MAX_BLOCK_SIZE", default=DEFAULT_MAX_BLOCK_SIZE))
-NUM_BLOCKS = int(os.environ.get("NUM_BLOCKS_PER_TEST", default=15))
 NUM_BLOCKS_DETAILED = 10
 NUM_ACCOUNTS = max(
     [
-        int(os.environ.get("NUM_INIT_ACCOUNTS", default=DEFAULT_NUM_INIT_ACCOUNTS)),
-        (2 + 2 * NUM_BLOCKS) * MAX_BLOCK_SIZE,
+        CONFIG.num_init_accounts,
+        (2 + 2 * CONFIG.num_blocks) * CONFIG.max_block_size,
     ]
 )
-MAIN_SIGNER_ACCOUNTS = 2 * MAX_BLOCK_SIZE
+MAIN_SIGNER_ACCOUNTS = 2 * CONFIG.max_block_size
 
 NOISE_LOWER_LIMIT = 0.98 if IS_MAINNET else 0.8
 NOISE_LOWER_LIMIT_WARN = 0.9
@@ -77,59 +152,81 @@ SKIP_PERF_IMPROVEMENT_NOTICE = IS_MAINNET
 # that are on top of this commit
 CODE_PERF_VERSION = "v6"
 
-# default to using production number of execution threads for assertions
-NUMBER_OF_EXECUTION_THREADS = int(
-    os.environ.get("NUMBER_OF_EXECUTION_THREADS", default=32)
-)
-
-if os.environ.get("DETAILED"):
+if CONFIG.detailed:
     EXECUTION_ONLY_NUMBER_OF_THREADS = [1, 2, 4, 8, 16, 32, 48, 60]
 else:
     EXECUTION_ONLY_NUMBER_OF_THREADS = []
 
-if os.environ.get("RELEASE_BUILD"):
-    BUILD_FLAG = "--release"
+if CONFIG.release_build:
+    BUILD_FLAG = ["--release"]
     BUILD_FOLDER = "target/release"
 else:
-    BUILD_FLAG = "--profile performance"
+    BUILD_FLAG = ["--profile", "performance"]
     BUILD_FOLDER = "target/performance"
 
-if os.environ.get("PROD_DB_FLAGS"):
-    DB_CONFIG_FLAGS = ""
+if CONFIG.prod_db_flags:
+    DB_CONFIG_FLAGS = []
 else:
-    DB_CONFIG_FLAGS = "--enable-storage-sharding"
+    DB_CONFIG_FLAGS = ["--enable-storage-sharding"]
 
-if os.environ.get("DISABLE_FA_APT"):
-    FEATURE_FLAGS = ""
-    SKIP_NATIVE = False
+if CONFIG.disable_fa_apt:
+    FEATURE_FLAGS = []
 else:
-    FEATURE_FLAGS = "--enable-feature NEW_ACCOUNTS_DEFAULT_TO_FA_APT_STORE --enable-feature OPERATIONS_DEFAULT_TO_FA_APT_STORE"
-    SKIP_NATIVE = True
+    FEATURE_FLAGS = [
+        "--enable-feature",
+        "NEW_ACCOUNTS_DEFAULT_TO_FA_APT_STORE",
+        "--enable-feature",
+        "OPERATIONS_DEFAULT_TO_FA_APT_STORE",
+    ]
 
-if os.environ.get("ENABLE_PRUNER"):
-    DB_PRUNER_FLAGS = "--enable-state-pruner --enable-ledger-pruner --enable-epoch-snapshot-pruner --ledger-pruning-batch-size 10000 --state-prune-window 3000000 --epoch-snapshot-prune-window 3000000 --ledger-prune-window 3000000"
+if CONFIG.enable_pruner:
+    DB_PRUNER_FLAGS = [
+        "--enable-state-pruner",
+        "--enable-ledger-pruner",
+        "--enable-epoch-snapshot-pruner",
+        "--ledger-pruning-batch-size",
+        "10000",
+        "--state-prune-window",
+        "3000000",
+        "--epoch-snapshot-prune-window",
+        "3000000",
+        "--ledger-prune-window",
+        "3000000",
+    ]
 else:
-    DB_PRUNER_FLAGS = ""
-
-HIDE_OUTPUT = os.environ.get("HIDE_OUTPUT")
-SKIP_MOVE_E2E = os.environ.get("SKIP_MOVE_E2E")
+    DB_PRUNER_FLAGS = []
+
+# benchmarks are run directly (without a shell), with this added to their environment
+BENCHMARK_ENV = {"RUST_BACKTRACE": "1"}
+BENCHMARK_BINARY = f"{BUILD_FOLDER}/aptos-executor-benchmark"
+
+# Test-independent parts of the run-executor command, built once. Per-test arguments go in between.
+TXN_EMITTER_ARGS = [] if CONFIG.num_blocks > 200 else ["--generate-then-execute"]
+RUN_EXECUTOR_ARGS = [*DB_CONFIG_FLAGS, *DB_PRUNER_FLAGS, "run-executor", *FEATURE_FLAGS]
+ADDITIONAL_DST_POOL_ACCOUNTS = 2 * CONFIG.max_block_size * CONFIG.num_blocks
+ACCOUNTS_ARGS = [
+    "--main-signer-accounts",
+    str(MAIN_SIGNER_ACCOUNTS),
+    "--additional-dst-pool-accounts",
+    str(ADDITIONAL_DST_POOL_ACCOUNTS),
+]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RunGroupKey:
     transaction_type: str
     module_working_set_size: int = field(default=1)
     executor_type: str = field(default="VM")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RunGroupKeyExtra:
     transaction_type_override: Optional[str] = field(default=None)
     transaction_weights_override: Optional[str] = field(default=None)
     sharding_traffic_flags: Optional[str] = field(default=None)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunGroupConfig:
     key: RunGroupKey
     included_in: Flow
@@ -156,6 +253,7 @@ CALIBRATED_COUNT_INDEX = -4
 CALIBRATED_MIN_RATIO_INDEX = -3
 CALIBRATED_MAX_RATIO_INDEX = -2
 CALIBRATION_SEPARATOR = "	"
+CALIBRATION_NUM_COLUMNS = 7
 
 # transaction_type	module_working_set_size	executor_type	count	min_ratio	max_ratio	median
 CALIBRATION = """
@@ -296,6 +394,17 @@ TESTS = [
 ]
 # fmt: on
 
+# Tests to run in this invocation, together with their index in TESTS (which is reported, to
+# keep results comparable across flows).
+# CONFIG.flow is a single flow, so membership is a plain bitmask test.
+_SELECTED_FLOW_MASK = CONFIG.flow.value
+ACTIVE_TESTS = [
+    (test_index, test)
+    for test_index, test in enumerate(TESTS)
+    if test.included_in.value & _SELECTED_FLOW_MASK
+    and not (CONFIG.skip_native and test.key.executor_type == "native")
+]
+
 # Run the single node with performance optimizations enabled
 target_directory = "execution/executor-benchmark/src"
 
@@ -307,42 +416,105 @@ class CmdExecutionError(Exception):
         self.output = output
 
 
-def execute_command(command):
-    print(f"Executing command:\n\t{command}\nand waiting for it to finish...")
-    result = []
+# size of reads from the command output pipe
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+
+def execute_command(
+    command: Sequence[str],
+    output_sinks: Sequence[Callable[[bytes], None]] = (),
+    hide_output: bool = CONFIG.hide_output,
+    extra_env: Optional[Mapping[str, str]] = None,
+    # False lets subprocess use posix_spawn (vfork-style) instead of fork+exec, for commands
+    # given by path. Descriptors opened by Python are non-inheritable anyway, so none leak.
+    close_fds: bool = True,
+):
+    env_prefix = "".join(f"{k}={v} " for k, v in (extra_env or {}).items())
+    print(
+        f"Executing command:\n\t{env_prefix}{shlex.join(command)}\nand waiting for it to finish..."
+    )
+    # Output only needs to be kept around if it is hidden, to be shown if the command fails.
+    # Otherwise it has already been streamed to stdout, and parsing is done by output_sinks.
+    hidden_output: Optional[List[bytes]] = [] if hide_output else None
+    has_error_line = False
+    # partial last line of the previous chunk
+    carry = b""
+
+    # Output is handled as bytes, and only decoded if it is printed after a failure: the
+    # check and the sinks work on bytes. Blocks are always whole lines, so they need no splitting.
+    def feed_output(text: bytes):
+        nonlocal has_error_line
+        if b" ERROR " in text:
+            has_error_line = True
+        # let sinks parse the output while it is being produced
+        for sink in output_sinks:
+            sink(text)
+
+    sys.stdout.flush()
     with Popen(
         command,
-        shell=True,
-        text=True,
         stdout=PIPE,
-        bufsize=1,
-        universal_newlines=True,
+        bufsize=-1,
+        env={**os.environ, **extra_env} if extra_env else None,
+        close_fds=close_fds,
     ) as p:
-        # stream to output while command is executing
+        # stream to output while command is executing.
+        # reads raw bytes in large chunks, instead of line by line.
         if p.stdout is not None:
-            for line in p.stdout:
-                if not HIDE_OUTPUT:
-                    print(line, end="")
-                result.append(line)
-
-    # return the full output in the end for postprocessing
-    full_result = "\n".join(result)
+            # resolved once, as this loop runs for every chunk of output
+            show_output = hidden_output is None
+            # os.read on the pipe returns whatever is available (up to the chunk size), like read1
+            fd = p.stdout.fileno()
+            stdout = sys.stdout.buffer
+            while chunk := os.read(fd, OUTPUT_CHUNK_SIZE):
+                if show_output:
+                    stdout.write(chunk)
+                    stdout.flush()
+                else:
+                    hidden_output.append(chunk)
+                # splitting on b"\n" is safe on UTF-8, it never occurs inside a multi-byte character
+                complete, _, carry = (carry + chunk).rpartition(b"\n")
+                if complete:
+                    feed_output(complete)
+
+    if carry:
+        feed_output(carry)
+
+    full_result = (
+        b"".join(hidden_output).decode("utf-8", errors="replace")
+        if hidden_output is not None
+        else None
+    )
 
     if p.returncode != 0:
-        if HIDE_OUTPUT:
+        if full_result is not None:
             print(full_result)
         raise CmdExecutionError(p.returncode, full_result)
 
-    if " ERROR " in full_result:
+    if has_error_line:
         print("ERROR log line in execution")
-        if HIDE_OUTPUT:
+        if full_result is not None:
             print(full_result)
         exit(1)
 
-    return full_result
+
+# columns of RunResults.display_row, as named in the full table
+DISPLAY_COLUMNS = [
+    "t/s",
+    "exe/total",
+    "vm/exe",
+    "commit/total",
+    "g/s",
+    "eff g/s",
+    "io g/s",
+    "exe g/s",
+    "g/t",
+    "fee/t",
+    "out B/s",
+]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResults:
     tps: float
     gps: float
@@ -355,9 +527,27 @@ class RunResults:
     fraction_in_execution: float
     fraction_of_execution_in_vm: float
     fraction_in_commit: float
+    # cells of the full table, formatted once, as results can be shown in many tables.
+    # (a field, not a cached_property, since slotted instances have no __dict__)
+    display_row: Tuple[Any, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.display_row = (
+            int(round(self.tps)),
+            round(self.fraction_in_execution, 3),
+            round(self.fraction_of_execution_in_vm, 3),
+            round(self.fraction_in_commit, 3),
+            int(round(self.gps)),
+            int(round(self.effective_gps)),
+            int(round(self.io_gps)),
+            int(round(self.execution_gps)),
+            int(round(self.gpt)),
+            int(round(self.storage_fee_pt)),
+            int(round(self.output_bps)),
+        )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunGroupInstance:
     key: RunGroupKey
     single_node_result: RunResults
@@ -366,7 +556,7 @@ class RunGroupInstance:
     expected_tps: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CalibrationData:
     expected_tps: float
     count: int
@@ -374,7 +564,7 @@ class CalibrationData:
     max_ratio: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Criteria:
     expected_tps: float
     min_tps: float
@@ -383,90 +573,201 @@ class Criteria:
     max_warn_tps: float
 
 
-def get_only(values):
-    assert len(values) == 1, "Multiple values parsed: " + str(values)
-    return values[0]
+CREATE_DB_TPS_PATTERN = re.compile(
+    rb"Overall TPS: create_db: account creation: (?P<tps>\d+\.?\d*) txn/s"
+)
 
+# (RunResults field, pattern for the rest of the line after the prefix)
+METRIC_LINE_PATTERNS = [
+    ("tps", r"TPS: (?P<tps>\d+\.?\d*) txn/s"),
+    ("gps", r"GPS: (?P<gps>\d+\.?\d*) gas/s"),
+    ("effective_gps", r"effectiveGPS: (?P<effective_gps>\d+\.?\d*) gas/s"),
+    ("io_gps", r"ioGPS: (?P<io_gps>\d+\.?\d*) gas/s"),
+    ("execution_gps", r"executionGPS: (?P<execution_gps>\d+\.?\d*) gas/s"),
+    ("gpt", r"GPT: (?P<gpt>\d+\.?\d*) gas/txn"),
+    ("storage_fee_pt", r"Storage fee: (?P<storage_fee_pt>\-?\d+\.?\d*) octas/txn"),
+    ("output_bps", r"output: (?P<output_bps>\d+\.?\d*) bytes/s"),
+    (
+        "fraction_in_execution",
+        r"fraction of total: (?P<fraction_in_execution>\d+\.?\d*) in execution",
+    ),
+    (
+        "fraction_of_execution_in_vm",
+        r"fraction of execution (?P<fraction_of_execution_in_vm>\d+\.?\d*) in VM",
+    ),
+    (
+        "fraction_in_commit",
+        r"fraction of total: (?P<fraction_in_commit>\d+\.?\d*) in commit",
+    ),
+]
 
-def extract_run_results(
-    output: str, prefix: str, create_db: bool = False
-) -> RunResults:
-    if create_db:
-        tps = float(
-            get_only(
-                re.findall(
-                    r"Overall TPS: create_db: account creation: (\d+\.?\d*) txn/s",
-                    output,
-                )
-            )
-        )
-        gps = 0
-        effective_gps = 0
-        io_gps = 0
-        execution_gps = 0
-        gpt = 0
-        storage_fee_pt = 0
-        output_bps = 0
-        fraction_in_execution = 0
-        fraction_of_execution_in_vm = 0
-        fraction_in_commit = 0
-    else:
-        tps = float(get_only(re.findall(prefix + r" TPS: (\d+\.?\d*) txn/s", output)))
-        gps = float(get_only(re.findall(prefix + r" GPS: (\d+\.?\d*) gas/s", output)))
-        effective_gps = float(
-            get_only(re.findall(prefix + r" effectiveGPS: (\d+\.?\d*) gas/s", output))
-        )
-        io_gps = float(
-            get_only(re.findall(prefix + r" ioGPS: (\d+\.?\d*) gas/s", output))
-        )
-        execution_gps = float(
-            get_only(re.findall(prefix + r" executionGPS: (\d+\.?\d*) gas/s", output))
+# Fraction metrics can be logged multiple times, and the last value is the one we want.
+# All other metrics must be logged exactly once.
+LAST_VALUE_METRICS = frozenset(
+    ["fraction_in_execution", "fraction_of_execution_in_vm", "fraction_in_commit"]
+)
+
+
+_METRICS_ALTERNATION = "(?:" + "|".join(p for _, p in METRIC_LINE_PATTERNS) + ")"
+
+
+def _compile_metrics(prefix_pattern: str) -> Pattern[bytes]:
+    # matched on the raw (bytes) command output
+    return re.compile(
+        ("(?P<prefix>" + prefix_pattern + ") " + _METRICS_ALTERNATION).encode()
+    )
+
+
+# Compiled patterns, keyed by prefix pattern. The same prefixes ("Overall", "Overall execution",
+# stages) are parsed for every test, so each pattern is compiled only once per run.
+_METRIC_PATTERNS: Dict[str, Pattern[bytes]] = {}
+# runs can execute concurrently (PARALLEL_RUNS), only taken on a cache miss
+_METRIC_PATTERNS_LOCK = threading.Lock()
+
+
+def _metrics_for(prefix_pattern: str) -> Pattern[bytes]:
+    pattern = _METRIC_PATTERNS.get(prefix_pattern)
+    if pattern is None:
+        with _METRIC_PATTERNS_LOCK:
+            pattern = _METRIC_PATTERNS.get(prefix_pattern)
+            if pattern is None:
+                pattern = _compile_metrics(prefix_pattern)
+                _METRIC_PATTERNS[prefix_pattern] = pattern
+    return pattern
+
+
+class MetricsExtractor:
+    """Incrementally collects RunResults for a single prefix.
+
+    Fed with blocks of raw command output (whole lines, as bytes), so results can be parsed while
+    the command is running, without rescanning the full output afterwards.
+    """
+
+    def __init__(self, prefix: str, create_db: bool = False):
+        self.prefix = prefix
+        self.marker = prefix.encode()
+        self.create_db = create_db
+        self.pattern = (
+            CREATE_DB_TPS_PATTERN if create_db else _metrics_for(re.escape(prefix))
         )
-        gpt = float(get_only(re.findall(prefix + r" GPT: (\d+\.?\d*) gas/txn", output)))
-        storage_fee_pt = float(
-            get_only(
-                re.findall(prefix + r" Storage fee: (\-?\d+\.?\d*) octas/txn", output)
+        self.values: Dict[str, float] = {}
+
+    def feed(self, text: bytes):
+        # almost no output lines contain metrics, a substring check is much cheaper than the regex
+        if self.marker not in text:
+            return
+        for match in self.pattern.finditer(text):
+            self.add(match)
+
+    def add(self, match: "re.Match[bytes]"):
+        # the metric group is the last one to close, so lastgroup names it
+        name = match.lastgroup
+        assert name is not None
+        value = float(match.group(name))
+        assert (
+            name in LAST_VALUE_METRICS or name not in self.values
+        ), f"Multiple values parsed for {self.prefix} {name}: {self.values.get(name)}, {value}"
+        self.values[name] = value
+
+    def results(self) -> RunResults:
+        if self.create_db:
+            assert "tps" in self.values, "Missing create_db TPS"
+            return RunResults(
+                tps=self.values["tps"],
+                gps=0,
+                effective_gps=0,
+                io_gps=0,
+                execution_gps=0,
+                gpt=0,
+                storage_fee_pt=0,
+                output_bps=0,
+                fraction_in_execution=0,
+                fraction_of_execution_in_vm=0,
+                fraction_in_commit=0,
             )
-        )
 
-        output_bps = float(
-            get_only(re.findall(prefix + r" output: (\d+\.?\d*) bytes/s", output))
-        )
-        fraction_in_execution = float(
-            re.findall(
-                prefix + r" fraction of total: (\d+\.?\d*) in execution", output
-            )[-1]
-        )
-        fraction_of_execution_in_vm = float(
-            re.findall(prefix + r" fraction of execution (\d+\.?\d*) in VM", output)[-1]
+        missing = [name for name, _ in METRIC_LINE_PATTERNS if name not in self.values]
+        assert not missing, f"Missing values for {self.prefix}: {missing}"
+        return RunResults(**self.values)
+
+
+STAGE_PREFIX = "Staged execution: stage {}:"
+
+
+class StreamingCollector:
+    """Incrementally collects RunResults for several prefixes, in a single pass over the output.
+
+    Prefixes are literal, except that "{}" matches any number (so STAGE_PREFIX covers all
+    stages), combined into one pattern. Each match is routed by the prefix it matched to a
+    MetricsExtractor, created when that prefix first shows up in the output.
+
+    Metric lines are rare (mostly the summary at the end of a run), so blocks without any of
+    the prefixes' literal starts (up to the first "{}") are skipped without running the regex.
+    """
+
+    def __init__(self, prefixes: Sequence[str]):
+        self.pattern = _metrics_for(
+            "|".join(
+                r"\d+".join(re.escape(part) for part in prefix.split("{}"))
+                for prefix in prefixes
+            )
         )
-        fraction_in_commit = float(
-            re.findall(prefix + r" fraction of total: (\d+\.?\d*) in commit", output)[
-                -1
-            ]
+        self.markers = [prefix.split("{}")[0].encode() for prefix in prefixes]
+        # keyed by the prefix as matched in the output
+        self.extractors: Dict[bytes, MetricsExtractor] = {}
+
+    def feed(self, text: bytes):
+        if not any(marker in text for marker in self.markers):
+            return
+        for match in self.pattern.finditer(text):
+            prefix = match.group("prefix")
+            extractor = self.extractors.get(prefix)
+            if extractor is None:
+                extractor = MetricsExtractor(prefix.decode())
+                self.extractors[prefix] = extractor
+            extractor.add(match)
+
+    def results(self, prefix: str) -> RunResults:
+        # a prefix that never showed up fails with the usual missing values assertion
+        return self.extractors.get(prefix.encode(), MetricsExtractor(prefix)).results()
+
+    def stage_results(self) -> List[Tuple[int, RunResults]]:
+        # stages are numbered consecutively from 0
+        results = []
+        for stage in itertools.count():
+            extractor = self.extractors.get(STAGE_PREFIX.format(stage).encode())
+            if extractor is None:
+                break
+            results.append((stage, extractor.results()))
+        return results
+
+
+def _render_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+    # minimal version of tabulate's "simple" format, for the per-test progress rows
+    table = [headers, *rows]
+    widths = [max(len(str(cell)) for cell in column) for column in zip(*table)]
+    lines = []
+    for row in table:
+        lines.append(
+            "  ".join(
+                str(cell).rjust(width)
+                if isinstance(cell, (int, float))
+                else str(cell).ljust(width)
+                for cell, width in zip(row, widths)
+            ).rstrip()
         )
-
-    return RunResults(
-        tps=tps,
-        gps=gps,
-        effective_gps=effective_gps,
-        io_gps=io_gps,
-        execution_gps=execution_gps,
-        gpt=gpt,
-        storage_fee_pt=storage_fee_pt,
-        output_bps=output_bps,
-        fraction_in_execution=fraction_in_execution,
-        fraction_of_execution_in_vm=fraction_of_execution_in_vm,
-        fraction_in_commit=fraction_in_commit,
-    )
+        if row is headers:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
 
 
-def print_table(
+def format_table(
     results: Sequence[RunGroupInstance],
     by_levels: bool,
     single_field: Optional[Tuple[str, Callable[[RunResults], Any]]],
     number_of_execution_threads=EXECUTION_ONLY_NUMBER_OF_THREADS,
-):
+    use_tabulate: bool = False,
+) -> str:
     headers = [
         "transaction_type",
         "module_working_set",
@@ -484,23 +785,12 @@ def print_table(
         field_name, _ = single_field
         headers.append(field_name)
     else:
-        headers.extend(
-            [
-                "t/s",
-                "exe/total",
-                "vm/exe",
-                "commit/total",
-                "g/s",
-                "eff g/s",
-                "io g/s",
-                "exe g/s",
-                "g/t",
-                "fee/t",
-                "out B/s",
-            ]
-        )
+        headers.extend(DISPLAY_COLUMNS)
 
     rows = []
+    # Stage rows share the thread sweep results (the same dict) of their test, so those cells
+    # are built once per dict. Keyed by id, which is stable while results are referenced here.
+    level_cells: Dict[int, List[Any]] = {}
     for result in results:
         row = [
             result.key.transaction_type,
@@ -512,305 +802,605 @@ def print_table(
         if by_levels:
             if single_field is not None:
                 _, field_getter = single_field
-                for num_threads in number_of_execution_threads:
-                    if num_threads in result.number_of_threads_results:
-                        row.append(
-                            field_getter(result.number_of_threads_results[num_threads])
+                threads_results = result.number_of_threads_results
+                cells = level_cells.get(id(threads_results))
+                if cells is None:
+                    cells = [
+                        (
+                            field_getter(threads_results[num_threads])
+                            if num_threads in threads_results
+                            else "-"
                         )
-                    else:
-                        row.append("-")
+                        for num_threads in number_of_execution_threads
+                    ]
+                    level_cells[id(threads_results)] = cells
+                row.extend(cells)
 
         if single_field is not None:
             _, field_getter = single_field
             row.append(field_getter(result.single_node_result))
         else:
-            row.append(int(round(result.single_node_result.tps)))
-            row.append(round(result.single_node_result.fraction_in_execution, 3))
-            row.append(round(result.single_node_result.fraction_of_execution_in_vm, 3))
-            row.append(round(result.single_node_result.fraction_in_commit, 3))
-            row.append(int(round(result.single_node_result.gps)))
-            row.append(int(round(result.single_node_result.effective_gps)))
-            row.append(int(round(result.single_node_result.io_gps)))
-            row.append(int(round(result.single_node_result.execution_gps)))
-            row.append(int(round(result.single_node_result.gpt)))
-            row.append(int(round(result.single_node_result.storage_fee_pt)))
-            row.append(int(round(result.single_node_result.output_bps)))
+            row.extend(result.single_node_result.display_row)
         rows.append(row)
 
-    print(tabulate(rows, headers=headers))
+    if use_tabulate:
+        return tabulate(rows, headers=headers)
+    else:
+        return _render_table(headers, rows)
 
 
-errors = []
-warnings = []
+def display_cell(column: str) -> Callable[[RunResults], Any]:
+    """Getter of a cell of RunResults.display_row, which is formatted only once per result."""
+    index = DISPLAY_COLUMNS.index(column)
+    return lambda r: r.display_row[index]
 
-with tempfile.TemporaryDirectory() as tmpdirname:
-    move_e2e_benchmark_failed = False
-    if not SKIP_MOVE_E2E:
-        execute_command(f"cargo build {BUILD_FLAG} --package aptos-move-e2e-benchmark")
-        try:
-            execute_command(f"RUST_BACKTRACE=1 {BUILD_FOLDER}/aptos-move-e2e-benchmark")
-        except:
-            # for land-blocking (i.e. on PR), fail immediately, for speedy response.
-            # Otherwise run all tests, and fail in the end.
-            if SELECTED_FLOW == Flow.LAND_BLOCKING:
-                print("Move E2E benchmark failed, exiting")
-                exit(1)
-            move_e2e_benchmark_failed = True
 
-    calibrated_expected_tps = {
-        RunGroupKey(
-            transaction_type=parts[0],
-            module_working_set_size=int(parts[1]),
-            executor_type=parts[2],
-        ): CalibrationData(
-            expected_tps=float(parts[CALIBRATED_TPS_INDEX]),
-            count=int(parts[CALIBRATED_COUNT_INDEX]),
-            min_ratio=float(parts[CALIBRATED_MIN_RATIO_INDEX]),
-            max_ratio=float(parts[CALIBRATED_MAX_RATIO_INDEX]),
-        )
-        for line in CALIBRATION.split("\n")
-        if len(
-            parts := [
-                part for part in line.strip().split(CALIBRATION_SEPARATOR) if part
-            ]
+# (by_levels, single_field) of the tables shown for the results, when output is not hidden
+RESULT_TABLES: List[Tuple[bool, Optional[Tuple[str, Callable[[RunResults], Any]]]]] = [
+    (True, ("t/s", display_cell("t/s"))),
+    (True, ("g/s", display_cell("g/s"))),
+    (False, ("gas/txn", display_cell("g/t"))),
+    (False, ("storage fee/txn", display_cell("fee/t"))),
+    (True, ("exe/total", display_cell("exe/total"))),
+    (True, ("vm/exe", display_cell("vm/exe"))),
+    (False, None),
+]
+
+
+def print_result_tables(results: Sequence[RunGroupInstance]):
+    # rendered first, and written out in one go
+    print(
+        "\n".join(
+            format_table(
+                results,
+                by_levels=by_levels,
+                single_field=single_field,
+                use_tabulate=True,
+            )
+            for by_levels, single_field in RESULT_TABLES
         )
-        >= 1
-    }
-    print(calibrated_expected_tps)
+    )
 
-    execute_command(f"cargo build {BUILD_FLAG} --package aptos-executor-benchmark")
-    print(f"Warmup - creating DB with {NUM_ACCOUNTS} accounts")
-    create_db_command = f"RUST_BACKTRACE=1 {BUILD_FOLDER}/aptos-executor-benchmark --block-size {MAX_BLOCK_SIZE} --execution-threads {NUMBER_OF_EXECUTION_THREADS} {DB_CONFIG_FLAGS} {DB_PRUNER_FLAGS} create-db {FEATURE_FLAGS} --data-dir {tmpdirname}/db --num-accounts {NUM_ACCOUNTS}"
-    output = execute_command(create_db_command)
 
-    results = []
+def criteria_from_expected_tps(expected_tps: float) -> Criteria:
+    return Criteria(
+        expected_tps=expected_tps,
+        min_tps=expected_tps * NOISE_LOWER_LIMIT,
+        min_warn_tps=expected_tps * NOISE_LOWER_LIMIT_WARN,
+        max_tps=expected_tps * NOISE_UPPER_LIMIT,
+        max_warn_tps=expected_tps * NOISE_UPPER_LIMIT_WARN,
+    )
 
-    results.append(
-        RunGroupInstance(
-            key=RunGroupKey("warmup"),
-            single_node_result=extract_run_results(output, "Overall", create_db=True),
-            number_of_threads_results={},
-            block_size=MAX_BLOCK_SIZE,
-            expected_tps=0,
-        )
+
+# warn thresholds are ratio**0.8; calibration ratios repeat a lot across tests
+@functools.lru_cache(maxsize=256)
+def _pow08(ratio: float) -> float:
+    return ratio**0.8
+
+
+def criteria_from_calibration(calibration: CalibrationData) -> Criteria:
+    return Criteria(
+        expected_tps=calibration.expected_tps,
+        min_tps=calibration.expected_tps
+        * (
+            1
+            - (1 - calibration.min_ratio) * (1 + 10.0 / calibration.count)
+            - 1.0 / calibration.count
+        ),
+        min_warn_tps=calibration.expected_tps * _pow08(calibration.min_ratio),
+        max_tps=calibration.expected_tps
+        * (
+            1
+            + (calibration.max_ratio - 1) * (1 + 10.0 / calibration.count)
+            + 1.0 / calibration.count
+        ),
+        max_warn_tps=calibration.expected_tps * _pow08(calibration.max_ratio),
     )
 
-    for (
-        test_index,
-        test,
-    ) in enumerate(TESTS):
-        if SELECTED_FLOW not in test.included_in:
-            continue
-
-        if SKIP_NATIVE and test.key.executor_type == "native":
-            continue
-
-        if test.expected_tps is not None:
-            print(f"WARNING: using uncalibrated TPS for {test.key}")
-            criteria = Criteria(
-                expected_tps=test.expected_tps,
-                min_tps=test.expected_tps * NOISE_LOWER_LIMIT,
-                min_warn_tps=test.expected_tps * NOISE_LOWER_LIMIT_WARN,
-                max_tps=test.expected_tps * NOISE_UPPER_LIMIT,
-                max_warn_tps=test.expected_tps * NOISE_UPPER_LIMIT_WARN,
-            )
-        else:
-            assert test.key in calibrated_expected_tps, test
-            cur_calibration = calibrated_expected_tps[test.key]
-            criteria = Criteria(
-                expected_tps=cur_calibration.expected_tps,
-                min_tps=cur_calibration.expected_tps
-                * (
-                    1
-                    - (1 - cur_calibration.min_ratio)
-                    * (1 + 10.0 / cur_calibration.count)
-                    - 1.0 / cur_calibration.count
-                ),
-                min_warn_tps=cur_calibration.expected_tps
-                * pow(cur_calibration.min_ratio, 0.8),
-                max_tps=cur_calibration.expected_tps
-                * (
-                    1
-                    + (cur_calibration.max_ratio - 1)
-                    * (1 + 10.0 / cur_calibration.count)
-                    + 1.0 / cur_calibration.count
-                ),
-                max_warn_tps=cur_calibration.expected_tps
-                * pow(cur_calibration.max_ratio, 0.8),
-            )
 
-        cur_block_size = int(min([criteria.expected_tps, MAX_BLOCK_SIZE]))
+calibrated_expected_tps: Dict[RunGroupKey, CalibrationData] = {}
+for line in CALIBRATION.splitlines():
+    # Tolerates stray separators (e.g. a trailing tab from copying the Humio CSV), as fields
+    # are indexed from the end.
+    parts = [part for part in line.strip().split(CALIBRATION_SEPARATOR) if part]
+    # skips empty lines (and header, if one is pasted in)
+    if len(parts) < CALIBRATION_NUM_COLUMNS or parts[0] == "transaction_type":
+        continue
+    key = RunGroupKey(
+        transaction_type=parts[0],
+        module_working_set_size=int(parts[1]),
+        executor_type=parts[2],
+    )
+    calibrated_expected_tps[key] = CalibrationData(
+        expected_tps=float(parts[CALIBRATED_TPS_INDEX]),
+        count=int(parts[CALIBRATED_COUNT_INDEX]),
+        min_ratio=float(parts[CALIBRATED_MIN_RATIO_INDEX]),
+        max_ratio=float(parts[CALIBRATED_MAX_RATIO_INDEX]),
+    )
+print(calibrated_expected_tps)
+
+# criteria only depend on the calibration, so compute them once upfront
+criteria_by_key = {
+    key: criteria_from_calibration(calibration)
+    for key, calibration in calibrated_expected_tps.items()
+}
+
+# fail fast, before spending time on builds and warmup
+uncalibrated_tests = [
+    test.key
+    for _, test in ACTIVE_TESTS
+    if test.expected_tps is None and test.key not in criteria_by_key
+]
+assert (
+    not uncalibrated_tests
+), f"Tests have neither calibration nor expected_tps: {uncalibrated_tests}"
+
+criteria_by_test_index: Dict[int, Criteria] = {
+    test_index: (
+        criteria_by_key[test.key]
+        if test.expected_tps is None
+        else criteria_from_expected_tps(test.expected_tps)
+    )
+    for test_index, test in ACTIVE_TESTS
+}
 
-        print(f"Testing {test.key}")
-        if test.key_extra.transaction_type_override == "":
-            workload_args_str = ""
-        else:
-            transaction_type_list = (
-                test.key_extra.transaction_type_override or test.key.transaction_type
-            )
-            transaction_weights_list = (
-                test.key_extra.transaction_weights_override or "1"
-            )
-            workload_args_str = f"--transaction-type {transaction_type_list} --transaction-weights {transaction_weights_list}"
 
-        sharding_traffic_flags = test.key_extra.sharding_traffic_flags or ""
+@dataclass(**DATACLASS_SLOTS)
+class BenchmarkRun:
+    """A single executor benchmark invocation of a test: one of its execution-only thread sweep runs, or its main run."""
 
-        if test.key.executor_type == "VM":
-            executor_type_str = "--transactions-per-sender 1"
-        elif test.key.executor_type == "native":
-            executor_type_str = "--use-native-executor --transactions-per-sender 1"
-        elif test.key.executor_type == "sharded":
-            executor_type_str = f"--num-executor-shards {NUMBER_OF_EXECUTION_THREADS} {sharding_traffic_flags}"
-        else:
-            raise Exception(f"executor type not supported {test.key.executor_type}")
-        txn_emitter_prefix_str = "" if NUM_BLOCKS > 200 else " --generate-then-execute"
+    # None for the main run
+    execution_threads: Optional[int]
+    # arguments before the DB directories, which depend on where the run gets scheduled
+    command: List[str]
+    blocks: int
+    # rough, from the expected TPS. Only used to order concurrent runs
+    estimated_seconds: float
 
-        ADDITIONAL_DST_POOL_ACCOUNTS = 2 * MAX_BLOCK_SIZE * NUM_BLOCKS
 
-        common_command_suffix = f"{executor_type_str} {txn_emitter_prefix_str} --block-size {cur_block_size} {DB_CONFIG_FLAGS} {DB_PRUNER_FLAGS} run-executor {FEATURE_FLAGS} {workload_args_str} --module-working-set-size {test.key.module_working_set_size} --main-signer-accounts {MAIN_SIGNER_ACCOUNTS} --additional-dst-pool-accounts {ADDITIONAL_DST_POOL_ACCOUNTS} --data-dir {tmpdirname}/db  --checkpoint-dir {tmpdirname}/cp"
+def prepare_test_runs(
+    test_index: int, test: RunGroupConfig
+) -> Tuple[int, List[BenchmarkRun]]:
+    """Returns the block size of the test, and its runs - thread sweep first, main run last."""
+    if test.expected_tps is not None:
+        print(f"WARNING: using uncalibrated TPS for {test.key}")
+    criteria = criteria_by_test_index[test_index]
 
-        number_of_threads_results = {}
+    cur_block_size = int(min([criteria.expected_tps, CONFIG.max_block_size]))
 
-        for execution_threads in EXECUTION_ONLY_NUMBER_OF_THREADS:
-            test_db_command = f"RUST_BACKTRACE=1 {BUILD_FOLDER}/aptos-executor-benchmark --execution-threads {execution_threads} --skip-commit {common_command_suffix} --blocks {NUM_BLOCKS_DETAILED}"
-            output = execute_command(test_db_command)
+    print(f"Testing {test.key}")
+    if test.key_extra.transaction_type_override == "":
+        workload_args = []
+    else:
+        transaction_type_list = (
+            test.key_extra.transaction_type_override or test.key.transaction_type
+        )
+        transaction_weights_list = test.key_extra.transaction_weights_override or "1"
+        workload_args = [
+            "--transaction-type",
+            *transaction_type_list.split(),
+            "--transaction-weights",
+            *transaction_weights_list.split(),
+        ]
 
-            number_of_threads_results[execution_threads] = extract_run_results(
-                output, "Overall execution"
-            )
+    sharding_traffic_flags = (test.key_extra.sharding_traffic_flags or "").split()
 
-        test_db_command = f"RUST_BACKTRACE=1 {BUILD_FOLDER}/aptos-executor-benchmark --execution-threads {NUMBER_OF_EXECUTION_THREADS} {common_command_suffix} --blocks {NUM_BLOCKS}"
-        output = execute_command(test_db_command)
+    if test.key.executor_type == "VM":
+        executor_type_args = ["--transactions-per-sender", "1"]
+    elif test.key.executor_type == "native":
+        executor_type_args = [
+            "--use-native-executor",
+            "--transactions-per-sender",
+            "1",
+        ]
+    elif test.key.executor_type == "sharded":
+        executor_type_args = [
+            "--num-executor-shards",
+            str(CONFIG.number_of_execution_threads),
+            *sharding_traffic_flags,
+        ]
+    else:
+        raise Exception(f"executor type not supported {test.key.executor_type}")
+
+    common_command_suffix = [
+        *executor_type_args,
+        *TXN_EMITTER_ARGS,
+        "--block-size",
+        str(cur_block_size),
+        *RUN_EXECUTOR_ARGS,
+        *workload_args,
+        "--module-working-set-size",
+        str(test.key.module_working_set_size),
+        *ACCOUNTS_ARGS,
+    ]
 
-        single_node_result = extract_run_results(output, "Overall")
-        stage_node_results = []
+    # Each thread count of the sweep needs its own process: the executor benchmark sets the VM
+    # concurrency level once per process (AptosVM::set_concurrency_level_once). Setup per run is
+    # only a checkpoint of the warmup DB, and runs can execute concurrently (PARALLEL_RUNS).
+    runs = [
+        BenchmarkRun(
+            execution_threads=execution_threads,
+            command=[
+                BENCHMARK_BINARY,
+                "--execution-threads",
+                str(execution_threads),
+                "--skip-commit",
+                *common_command_suffix,
+            ],
+            blocks=NUM_BLOCKS_DETAILED,
+            # expected TPS is for the full number of threads, fewer threads are slower
+            estimated_seconds=NUM_BLOCKS_DETAILED
+            * cur_block_size
+            / criteria.expected_tps
+            * max(1.0, CONFIG.number_of_execution_threads / execution_threads),
+        )
+        for execution_threads in EXECUTION_ONLY_NUMBER_OF_THREADS
+    ]
+    runs.append(
+        BenchmarkRun(
+            execution_threads=None,
+            command=[
+                BENCHMARK_BINARY,
+                "--execution-threads",
+                str(CONFIG.number_of_execution_threads),
+                *common_command_suffix,
+            ],
+            blocks=CONFIG.num_blocks,
+            estimated_seconds=CONFIG.num_blocks
+            * cur_block_size
+            / criteria.expected_tps,
+        )
+    )
+    return cur_block_size, runs
+
+
+def execute_run(
+    run: BenchmarkRun, run_dir: str, hide_output: bool
+) -> Tuple[RunResults, List[Tuple[int, RunResults]]]:
+    """Runs against the DB in run_dir. Returns the overall results, and per-stage results of a main run."""
+    command = [
+        *run.command,
+        "--data-dir",
+        f"{run_dir}/db",
+        "--checkpoint-dir",
+        f"{run_dir}/cp",
+        "--blocks",
+        str(run.blocks),
+    ]
+    if run.execution_threads is not None:
+        execution_extractor = MetricsExtractor("Overall execution")
+        execute_command(
+            command,
+            output_sinks=[execution_extractor.feed],
+            hide_output=hide_output,
+            extra_env=BENCHMARK_ENV,
+            close_fds=False,
+        )
+        return execution_extractor.results(), []
 
-        for i in itertools.count():
-            prefix = f"Staged execution: stage {i}:"
-            if prefix in output:
-                stage_node_results.append((i, extract_run_results(output, prefix)))
-            else:
-                break
+    collector = StreamingCollector(["Overall", STAGE_PREFIX])
+    execute_command(
+        command,
+        output_sinks=[collector.feed],
+        hide_output=hide_output,
+        extra_env=BENCHMARK_ENV,
+        close_fds=False,
+    )
+    return collector.results("Overall"), collector.stage_results()
+
+
+def collect_test_results(
+    test: RunGroupConfig,
+    criteria: Criteria,
+    cur_block_size: int,
+    runs: Sequence[BenchmarkRun],
+    run_results: Sequence[Tuple[RunResults, List[Tuple[int, RunResults]]]],
+) -> List[RunGroupInstance]:
+    """Returns the overall result of the test first, followed by per-stage results."""
+    number_of_threads_results = {
+        run.execution_threads: result
+        for run, (result, _) in zip(runs, run_results)
+        if run.execution_threads is not None
+    }
+    single_node_result, stage_node_results = run_results[-1]
 
-        results.append(
+    test_results = [
+        RunGroupInstance(
+            key=test.key,
+            single_node_result=single_node_result,
+            number_of_threads_results=number_of_threads_results,
+            block_size=cur_block_size,
+            expected_tps=criteria.expected_tps,
+        )
+    ]
+
+    for stage, stage_node_result in stage_node_results:
+        test_results.append(
             RunGroupInstance(
-                key=test.key,
-                single_node_result=single_node_result,
+                key=RunGroupKey(
+                    transaction_type=test.key.transaction_type + f" [stage {stage}]",
+                    module_working_set_size=test.key.module_working_set_size,
+                    executor_type=test.key.executor_type,
+                ),
+                single_node_result=stage_node_result,
                 number_of_threads_results=number_of_threads_results,
                 block_size=cur_block_size,
                 expected_tps=criteria.expected_tps,
             )
         )
 
-        for stage, stage_node_result in stage_node_results:
-            results.append(
-                RunGroupInstance(
-                    key=RunGroupKey(
-                        transaction_type=test.key.transaction_type
-                        + f" [stage {stage}]",
-                        module_working_set_size=test.key.module_working_set_size,
-                        executor_type=test.key.executor_type,
-                    ),
-                    single_node_result=stage_node_result,
-                    number_of_threads_results=number_of_threads_results,
-                    block_size=cur_block_size,
-                    expected_tps=criteria.expected_tps,
-                )
-            )
+    return test_results
+
+
+def split_cpus(num_slots: int) -> List[Optional[Set[int]]]:
+    """Splits the available CPUs into disjoint contiguous sets, one per concurrent run slot.
+
+    None (no pinning) with a single slot, without sched_setaffinity support, or when there are
+    fewer CPUs than slots.
+    """
+    if num_slots <= 1 or not hasattr(os, "sched_getaffinity"):
+        return [None] * num_slots
+    cpus = sorted(os.sched_getaffinity(0))
+    per_slot = len(cpus) // num_slots
+    if per_slot == 0:
+        return [None] * num_slots
+    return [set(cpus[i * per_slot : (i + 1) * per_slot]) for i in range(num_slots)]
+
+
+# Fields of the per-test Humio line that are the same for all tests, encoded once.
+# Ends where the per-test fields get appended (the per-test object without its "{").
+HUMIO_LINE_PREFIX = (
+    json.dumps(
+        {
+            "grep": "grep_json_single_node_perf",
+            "source": CONFIG.source,
+            "runner_name": CONFIG.runner_name,
+            "execution_threads": CONFIG.number_of_execution_threads,
+            "warmup_num_accounts": NUM_ACCOUNTS,
+            "code_perf_version": CODE_PERF_VERSION,
+            "flow": str(CONFIG.flow),
+        }
+    )[:-1]
+    + ", "
+)
+
+errors = []
+warnings = []
 
-        # line to be able to aggreate and visualize in Humio
-        print(
-            json.dumps(
-                {
-                    "grep": "grep_json_single_node_perf",
-                    "source": SOURCE,
-                    "runner_name": RUNNER_NAME,
-                    "transaction_type": test.key.transaction_type,
-                    "module_working_set_size": test.key.module_working_set_size,
-                    "executor_type": test.key.executor_type,
-                    "block_size": cur_block_size,
-                    "execution_threads": NUMBER_OF_EXECUTION_THREADS,
-                    "warmup_num_accounts": NUM_ACCOUNTS,
-                    "expected_tps": criteria.expected_tps,
-                    "expected_min_tps": criteria.min_tps,
-                    "expected_max_tps": criteria.max_tps,
-                    "waived": test.waived,
-                    "tps": single_node_result.tps,
-                    "gps": single_node_result.gps,
-                    "gpt": single_node_result.gpt,
-                    "code_perf_version": CODE_PERF_VERSION,
-                    "flow": str(SELECTED_FLOW),
-                    "test_index": test_index,
-                }
+with tempfile.TemporaryDirectory() as tmpdirname:
+    move_e2e_benchmark_failed = False
+    if not CONFIG.skip_move_e2e:
+        execute_command(
+            ["cargo", "build", *BUILD_FLAG, "--package", "aptos-move-e2e-benchmark"]
+        )
+        try:
+            execute_command(
+                [f"{BUILD_FOLDER}/aptos-move-e2e-benchmark"], extra_env=BENCHMARK_ENV
             )
+        except:
+            # for land-blocking (i.e. on PR), fail immediately, for speedy response.
+            # Otherwise run all tests, and fail in the end.
+            if CONFIG.flow == Flow.LAND_BLOCKING:
+                print("Move E2E benchmark failed, exiting")
+                exit(1)
+            move_e2e_benchmark_failed = True
+
+    execute_command(
+        ["cargo", "build", *BUILD_FLAG, "--package", "aptos-executor-benchmark"]
+    )
+    print(f"Warmup - creating DB with {NUM_ACCOUNTS} accounts")
+    create_db_command = [
+        BENCHMARK_BINARY,
+        "--block-size",
+        str(CONFIG.max_block_size),
+        "--execution-threads",
+        str(CONFIG.number_of_execution_threads),
+        *DB_CONFIG_FLAGS,
+        *DB_PRUNER_FLAGS,
+        "create-db",
+        *FEATURE_FLAGS,
+        "--data-dir",
+        f"{tmpdirname}/db",
+        "--num-accounts",
+        str(NUM_ACCOUNTS),
+    ]
+    create_db_extractor = MetricsExtractor("Overall", create_db=True)
+    execute_command(
+        create_db_command,
+        output_sinks=[create_db_extractor.feed],
+        extra_env=BENCHMARK_ENV,
+        close_fds=False,
+    )
+
+    results = []
+
+    results.append(
+        RunGroupInstance(
+            key=RunGroupKey("warmup"),
+            single_node_result=create_db_extractor.results(),
+            number_of_threads_results={},
+            block_size=CONFIG.max_block_size,
+            expected_tps=0,
         )
+    )
 
-        if not HIDE_OUTPUT:
-            print_table(
-                results,
-                by_levels=True,
-                single_field=("t/s", lambda r: int(round(r.tps))),
-            )
-            print_table(
-                results,
-                by_levels=True,
-                single_field=("g/s", lambda r: int(round(r.gps))),
-            )
-            print_table(
-                results,
-                by_levels=False,
-                single_field=("gas/txn", lambda r: int(round(r.gpt))),
-            )
-            print_table(
-                results,
-                by_levels=False,
-                single_field=(
-                    "storage fee/txn",
-                    lambda r: int(round(r.storage_fee_pt)),
-                ),
+    # Each concurrently executing run needs its own DB: creating a checkpoint opens the source DB
+    # for writing (and locks it). Runs therefore share a pool of directories, with a copy of the
+    # warmup DB in each.
+    # Each slot also gets its own set of CPUs, so concurrent runs don't migrate across each other's cores.
+    run_slots: "queue.SimpleQueue[Tuple[str, Optional[Set[int]]]]" = queue.SimpleQueue()
+    num_runs = len(ACTIVE_TESTS) * (len(EXECUTION_ONLY_NUMBER_OF_THREADS) + 1)
+    num_slots = min(CONFIG.parallel_runs, num_runs)
+    all_slot_cpus = split_cpus(num_slots)
+    for slot, slot_cpus in enumerate(all_slot_cpus):
+        if slot == 0:
+            slot_dir = tmpdirname
+        else:
+            slot_dir = f"{tmpdirname}/slot{slot}"
+            shutil.copytree(f"{tmpdirname}/db", f"{slot_dir}/db")
+        run_slots.put((slot_dir, slot_cpus))
+    if num_slots > 1:
+        max_threads = max(
+            EXECUTION_ONLY_NUMBER_OF_THREADS + [CONFIG.number_of_execution_threads]
+        )
+        slot_cpus = all_slot_cpus[0]
+        if slot_cpus is not None:
+            # each run only gets its slot's pinned CPUs
+            if max_threads > len(slot_cpus):
+                print(
+                    f"WARNING: runs with up to {max_threads} execution threads are pinned to {len(slot_cpus)} CPUs each, TPS will be affected"
+                )
+        elif num_slots * max_threads > (os.cpu_count() or 1):
+            print(
+                f"WARNING: {num_slots} concurrent runs with up to {max_threads} execution threads each oversubscribe {os.cpu_count()} CPUs, TPS will be affected"
             )
-            print_table(
-                results,
-                by_levels=True,
-                single_field=("exe/total", lambda r: round(r.fraction_in_execution, 3)),
+
+    def execute_run_in_free_dir(run: BenchmarkRun):
+        run_dir, cpus = run_slots.get()
+        try:
+            if cpus is not None:
+                # On Linux, pid 0 is the calling (worker) thread, and the benchmark process
+                # spawned from it inherits its affinity.
+                os.sched_setaffinity(0, cpus)
+            # output of concurrent runs would interleave, so it is only shown on failure
+            return execute_run(run, run_dir, hide_output=True)
+        finally:
+            run_slots.put((run_dir, cpus))
+
+    # all runs submitted to the executor, so the pending ones can be cancelled on failure
+    submitted_futures: List[
+        "Future[Tuple[RunResults, List[Tuple[int, RunResults]]]]"
+    ] = []
+
+    def run_tests(executor: Optional[ThreadPoolExecutor]):
+        """Yields results of each test, in test order."""
+        if executor is None:
+            for test_index, test in ACTIVE_TESTS:
+                cur_block_size, runs = prepare_test_runs(test_index, test)
+                run_results = [
+                    execute_run(run, tmpdirname, hide_output=CONFIG.hide_output)
+                    for run in runs
+                ]
+                yield test_index, test, cur_block_size, runs, run_results
+            return
+
+        # All runs (of all tests) are queued up front, so idle workers pick up any pending run.
+        # Longest first, so the runs left at the end are short, and workers finish close together.
+        scheduled = [
+            (test_index, test, *prepare_test_runs(test_index, test))
+            for test_index, test in ACTIVE_TESTS
+        ]
+        futures: Dict[
+            int, "Future[Tuple[RunResults, List[Tuple[int, RunResults]]]]"
+        ] = {}
+        for run in sorted(
+            (run for _, _, _, runs in scheduled for run in runs),
+            key=lambda run: run.estimated_seconds,
+            reverse=True,
+        ):
+            future = executor.submit(execute_run_in_free_dir, run)
+            futures[id(run)] = future
+            submitted_futures.append(future)
+
+        # Runs are watched in completion order, so a failed run (CmdExecutionError, or exit on an
+        # ERROR line) is raised right away, not only once all tests before it are reported.
+        # Tests are still yielded in order, as soon as all of their runs are done.
+        next_test = 0
+        for completed in as_completed(submitted_futures):
+            completed.result()
+            while next_test < len(scheduled) and all(
+                futures[id(run)].done() for run in scheduled[next_test][3]
+            ):
+                test_index, test, cur_block_size, runs = scheduled[next_test]
+                run_results = [futures[id(run)].result() for run in runs]
+                yield test_index, test, cur_block_size, runs, run_results
+                next_test += 1
+
+    # A thread per concurrent run is enough: workers spend their time blocked in execute_command's
+    # 64KB pipe reads (which release the GIL), so ~one read syscall per chunk per child, and parsing
+    # is a regex scan per chunk. An event loop would only multiplex those same reads.
+    executor = (
+        ThreadPoolExecutor(max_workers=CONFIG.parallel_runs)
+        if CONFIG.parallel_runs > 1
+        else None
+    )
+
+    try:
+        for test_index, test, cur_block_size, runs, run_results in run_tests(executor):
+            criteria = criteria_by_test_index[test_index]
+            test_results = collect_test_results(
+                test, criteria, cur_block_size, runs, run_results
             )
-            print_table(
-                results,
-                by_levels=True,
-                single_field=(
-                    "vm/exe",
-                    lambda r: round(r.fraction_of_execution_in_vm, 3),
-                ),
+            single_node_result = test_results[0].single_node_result
+            results.extend(test_results)
+
+            # line to be able to aggreate and visualize in Humio
+            print(
+                HUMIO_LINE_PREFIX
+                + json.dumps(
+                    {
+                        "transaction_type": test.key.transaction_type,
+                        "module_working_set_size": test.key.module_working_set_size,
+                        "executor_type": test.key.executor_type,
+                        "block_size": cur_block_size,
+                        "expected_tps": criteria.expected_tps,
+                        "expected_min_tps": criteria.min_tps,
+                        "expected_max_tps": criteria.max_tps,
+                        "waived": test.waived,
+                        "tps": single_node_result.tps,
+                        "gps": single_node_result.gps,
+                        "gpt": single_node_result.gpt,
+                        "test_index": test_index,
+                    }
+                )[1:]
             )
-            print_table(results, by_levels=False, single_field=None)
 
-        if single_node_result.tps < criteria.min_tps:
-            text = f"regression detected {single_node_result.tps}, expected median {criteria.expected_tps}, threshold: {criteria.min_tps}), {test.key} didn't meet TPS requirements"
-            if not test.waived:
-                errors.append(text)
-            else:
+            if not CONFIG.hide_output:
+                if CONFIG.verbose_progress:
+                    print_result_tables(results)
+                else:
+                    # only the rows of this test, all tables are printed once at the end
+                    print(
+                        format_table(test_results, by_levels=False, single_field=None)
+                    )
+
+            if single_node_result.tps < criteria.min_tps:
+                text = f"regression detected {single_node_result.tps}, expected median {criteria.expected_tps}, threshold: {criteria.min_tps}), {test.key} didn't meet TPS requirements"
+                if not test.waived:
+                    errors.append(text)
+                else:
+                    warnings.append(text)
+            elif single_node_result.tps < criteria.min_warn_tps:
+                text = f"potential (but within normal noise) regression detected {single_node_result.tps}, expected median {criteria.expected_tps}, threshold: {criteria.min_warn_tps}), {test.key} didn't meet TPS requirements"
                 warnings.append(text)
-        elif single_node_result.tps < criteria.min_warn_tps:
-            text = f"potential (but within normal noise) regression detected {single_node_result.tps}, expected median {criteria.expected_tps}, threshold: {criteria.min_warn_tps}), {test.key} didn't meet TPS requirements"
-            warnings.append(text)
-        elif (
-            not SKIP_PERF_IMPROVEMENT_NOTICE
-            and single_node_result.tps > criteria.max_tps
-        ):
-            text = f"perf improvement detected {single_node_result.tps}, expected median {criteria.expected_tps}, threshold: {criteria.max_tps}), {test.key} exceeded TPS requirements, increase TPS requirements to match new baseline"
-            if not test.waived:
-                errors.append(text)
-            else:
+            elif (
+                not SKIP_PERF_IMPROVEMENT_NOTICE
+                and single_node_result.tps > criteria.max_tps
+            ):
+                text = f"perf improvement detected {single_node_result.tps}, expected median {criteria.expected_tps}, threshold: {criteria.max_tps}), {test.key} exceeded TPS requirements, increase TPS requirements to match new baseline"
+                if not test.waived:
+                    errors.append(text)
+                else:
+                    warnings.append(text)
+            elif (
+                not SKIP_PERF_IMPROVEMENT_NOTICE
+                and single_node_result.tps > criteria.max_warn_tps
+            ):
+                text = f"potential (but within normal noise) perf improvement detected {single_node_result.tps}, expected median {criteria.expected_tps}, threshold: {criteria.max_warn_tps}), {test.key} exceeded TPS requirements, increase TPS requirements to match new baseline"
                 warnings.append(text)
-        elif (
-            not SKIP_PERF_IMPROVEMENT_NOTICE
-            and single_node_result.tps > criteria.max_warn_tps
-        ):
-            text = f"potential (but within normal noise) perf improvement detected {single_node_result.tps}, expected median {criteria.expected_tps}, threshold: {criteria.max_warn_tps}), {test.key} exceeded TPS requirements, increase TPS requirements to match new baseline"
-            warnings.append(text)
-
-if HIDE_OUTPUT:
-    print_table(results, by_levels=False, single_field=None)
+    finally:
+        if executor is not None:
+            # On failure, queued runs must not start: the DB copies are deleted with the temporary
+            # directory. Cancelling runs that already started or finished is a no-op, and those
+            # are waited for. (Manual, as shutdown(cancel_futures=True) needs Python 3.9.)
+            for future in submitted_futures:
+                future.cancel()
+            executor.shutdown()
+
+if CONFIG.hide_output:
+    print(format_table(results, by_levels=False, single_field=None, use_tabulate=True))
+elif not CONFIG.verbose_progress:
+    print_result_tables(results)
 
 if warnings:
     print("Warnings: ")